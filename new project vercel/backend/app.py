@@ -2,27 +2,53 @@ import os
 import tempfile
 import uuid
 import re
-from datetime import datetime, timedelta
+import json
+import hashlib
+import inspect
+import sqlite3
+import threading
+import time
+import atexit
+import weakref
+import multiprocessing
+from datetime import datetime
 import shutil
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import fitz  # PyMuPDF
 import pdfplumber
+import numpy as np
 import pandas as pd
-from flask import Flask, request, jsonify, send_file
+import xlsxwriter
+from flask import Flask, Response, request, jsonify, send_file
 from flask_cors import CORS
+from werkzeug.exceptions import HTTPException
 from werkzeug.utils import secure_filename
 import PyPDF2
 import logging
 
+try:
+    import orjson  # optional - faster JSON responses, falls back to json
+except ImportError:
+    orjson = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 app = Flask(__name__)
 CORS(app)
+application = app  # WSGI entry point for gunicorn/waitress
 
 UPLOAD_FOLDER = os.path.join(tempfile.gettempdir(), 'sds_uploads')
 PROCESSED_FOLDER = os.path.join(tempfile.gettempdir(), 'sds_processed')
 ALLOWED_EXTENSIONS_PDF = {'pdf'}
 ALLOWED_EXTENSIONS_EXCEL = {'xlsx', 'xls'}
+UPLOAD_BUFFER_SIZE = 1 << 20  # 1 MiB copy buffer when saving uploads
+CLEANUP_WORKERS = min(32, (os.cpu_count() or 1) * 4)  # removal is I/O bound
+# Parsed SDS data keyed by parser version and text hash - kept outside
+# PROCESSED_FOLDER so it can't be fetched through the download endpoint
+SDS_CACHE_PATH = os.path.join(tempfile.gettempdir(), 'sds_cache.sqlite3')
 
 # Create directories if they don't exist
 os.makedirs(UPLOAD_FOLDER, exist_ok=True)
@@ -50,149 +76,350 @@ COLUMNS = [
     "Source of Information"
 ]
 
+# Values treated as "no data". parse_sds_data canonicalizes these to "NDA"
+_MISSING = frozenset({"", "NDA", "nda", "N/A", "n/a", None})
+_MISSING_NUMERIC = frozenset({"nda", "n/a", "not available"})  # lowercase
+
+# Precompiled regex patterns - compiled once at import instead of on every parse
+_NUMBER_RE = re.compile(r'([\d,]+[.,]?\d*)')
+
+# Comprehensive patterns for flammable limits
+_FLAMMABLE_RES = [re.compile(p, re.IGNORECASE | re.MULTILINE | re.DOTALL) for p in [
+    # Pattern 1: LEL and UEL on same line with percentages
+    r"LEL[:\s]*(\d+(?:\.\d+)?)\s*%.*?UEL[:\s]*(\d+(?:\.\d+)?)\s*%",
+    r"Lower\s+explosive\s+limit[:\s]*(\d+(?:\.\d+)?)\s*%.*?Upper\s+explosive\s+limit[:\s]*(\d+(?:\.\d+)?)\s*%",
+    r"LFL[:\s]*(\d+(?:\.\d+)?)\s*%.*?UFL[:\s]*(\d+(?:\.\d+)?)\s*%",
+
+    # Pattern 2: Range format like "2.1 - 12.8%" or "2.1% - 12.8%"
+    r"(?:LEL|Lower\s+explosive\s+limit|LFL|Flammable\s+limits?)[:\s]*(\d+(?:\.\d+)?)\s*%?\s*[-–—]\s*(\d+(?:\.\d+)?)\s*%",
+    r"Explosive\s+limits?[:\s]*(\d+(?:\.\d+)?)\s*%?\s*[-–—]\s*(\d+(?:\.\d+)?)\s*%",
+    r"Flammability\s+limits?[:\s]*(\d+(?:\.\d+)?)\s*%?\s*[-–—]\s*(\d+(?:\.\d+)?)\s*%",
+
+    # Pattern 3: Parentheses format like "(2.1 - 12.8%)" or "(LEL: 2.1%, UEL: 12.8%)"
+    r"\(\s*(\d+(?:\.\d+)?)\s*%?\s*[-–—]\s*(\d+(?:\.\d+)?)\s*%?\s*\)",
+    r"\(\s*LEL[:\s]*(\d+(?:\.\d+)?)\s*%.*?UEL[:\s]*(\d+(?:\.\d+)?)\s*%\s*\)",
+
+    # Pattern 4: Table-like format with vol% or volume%
+    r"(?:LEL|Lower)[:\s]*(\d+(?:\.\d+)?)\s*(?:vol\s*%|%\s*vol|%|volume\s*%).*?(?:UEL|Upper)[:\s]*(\d+(?:\.\d+)?)\s*(?:vol\s*%|%\s*vol|%|volume\s*%)",
+
+    # Pattern 5: Simple numeric range without explicit LEL/UEL labels but in flammable context
+    r"(?:Flammable|Explosive)\s+(?:range|limits?)[:\s]*(\d+(?:\.\d+)?)\s*[-–—]\s*(\d+(?:\.\d+)?)\s*%",
+
+    # Pattern 6: Individual LEL/UEL on separate lines
+    r"LEL[:\s]*(\d+(?:\.\d+)?)\s*%",
+    r"UEL[:\s]*(\d+(?:\.\d+)?)\s*%",
+]]
+_FLAMMABLE_PAIR_RES = _FLAMMABLE_RES[:5]  # First 5 patterns capture both values
+
+_LEL_RES = [re.compile(p, re.IGNORECASE) for p in [
+    r"LEL[:\s]*(\d+(?:\.\d+)?)\s*%",
+    r"Lower\s+explosive\s+limit[:\s]*(\d+(?:\.\d+)?)\s*%",
+    r"LFL[:\s]*(\d+(?:\.\d+)?)\s*%",
+    r"Lower\s+flammable\s+limit[:\s]*(\d+(?:\.\d+)?)\s*%"
+]]
+
+_UEL_RES = [re.compile(p, re.IGNORECASE) for p in [
+    r"UEL[:\s]*(\d+(?:\.\d+)?)\s*%",
+    r"Upper\s+explosive\s+limit[:\s]*(\d+(?:\.\d+)?)\s*%",
+    r"UFL[:\s]*(\d+(?:\.\d+)?)\s*%",
+    r"Upper\s+flammable\s+limit[:\s]*(\d+(?:\.\d+)?)\s*%"
+]]
+
+# Keyword-only patterns below are lowercase and matched against the lowercased
+# text, which is cheaper than case-insensitive matching
+
+# Explicit "not applicable" or "non-flammable" statements
+# combined into one alternation since only whether any of them matches is used
+_NON_FLAMMABLE_RE = re.compile("|".join([
+    r"not\s+flammable",
+    r"non[-\s]?flammable",
+    r"flammable\s+limits?\s*:?\s*(?:not\s+applicable|n/?a)",
+    r"explosive\s+limits?\s*:?\s*(?:not\s+applicable|n/?a)",
+    r"does\s+not\s+burn",
+    r"will\s+not\s+burn",
+    r"non[-\s]?combustible"
+]))
+
+# CAS Number patterns - handles complete CAS number format
+_CAS_RES = [re.compile(p, re.IGNORECASE | re.MULTILINE) for p in [
+    r"CAS-No\.?\s*[:\-]?\s*[\[\(]?\s*(\d{2,7}-\d{2}-\d)\s*[\]\)]?",
+    r"CAS\s+No\.?\s*[:\-]?\s*[\[\(]?\s*(\d{2,7}-\d{2}-\d)\s*[\]\)]?",
+    r"CAS\s+number\s*[:\-]?\s*[\[\(]?\s*(\d{2,7}-\d{2}-\d)\s*[\]\)]?",
+    r"CAS#?\s*[:\-]?\s*[\[\(]?\s*(\d{2,7}-\d{2}-\d)\s*[\]\)]?",
+    r"【CAS】\s*[:\-]?\s*[\[\(]?\s*(\d{2,7}-\d{2}-\d)\s*[\]\)]?",
+    # More flexible pattern for various CAS formats
+    r"(?:CAS|cas)(?:\s*-?\s*(?:No|NUMBER|#))?\s*[:\-]?\s*[\[\(]?\s*(\d{2,7}-\d{2}-\d)\s*[\]\)]?",
+    # Pattern for standalone CAS numbers (more restrictive to avoid false positives)
+    r"\b(\d{2,7}-\d{2}-\d)\b"
+]]
+
+# Patterns that indicate a static hazard
+_STATIC_RES = [re.compile(p) for p in [
+    r"static\s+discharge",
+    r"electrostatic\s+discharge",
+    r"static\s+electricity",
+    r"electrostatic\s+charge",
+    r"static\s+charge",
+    r"precautionary\s+measures\s+against\s+static\s+discharge",
+    r"measures\s+to\s+prevent.*static",
+    r"ground.*bond.*container",
+    r"grounding.*bonding",
+    r"anti[-\s]?static",
+    r"static\s+sensitive",
+    r"electrostatic\s+ignition",
+    r"static\s+buildup"
+]]
+
+# Patterns that indicate NO static hazard
+_NO_STATIC_RES = [re.compile(p) for p in [
+    r"no\s+static\s+hazard",
+    r"static\s+hazard\s*:?\s*no",
+    r"not\s+static\s+sensitive",
+    r"no\s+electrostatic\s+hazard",
+    r"static\s+discharge\s*:?\s*not\s+applicable",
+    r"static\s+discharge\s*:?\s*n/?a"
+]]
+
+# Handling/storage sections where static info might be expected
+_HANDLING_RES = [re.compile(p) for p in [
+    r"section\s*7.*?(?:handling|storage)",
+    r"handling\s+and\s+storage",
+    r"precautions\s+for\s+safe\s+handling",
+    r"storage\s+conditions"
+]]
+
+# Vapor pressure patterns paired with the unit used for conversion to mmHg
+_VP_RES = [(re.compile(p, re.IGNORECASE), unit) for p, unit in [
+    (r"Vapou?r\s+pressure\s*:?\s*([\d,]+[.,]?\d*)\s*atm", "atm"),
+    (r"Vapou?r\s+pressure\s*:?\s*([\d,]+[.,]?\d*)\s*mmHg", "mmHg"),
+    (r"Vapou?r\s+pressure\s*:?\s*([\d,]+[.,]?\d*)\s*Pa", "Pa"),
+    (r"Pressure\s*:?\s*([\d,]+[.,]?\d*)\s*(?:atm|mmHg|Pa)", "atm")
+]]
+_TEMP_RE = re.compile(r"(?:at|@)\s*(\d+)\s*°?C", re.IGNORECASE)
+
+# Field patterns used with find_between
+_FIELD_FLAGS = re.IGNORECASE | re.MULTILINE
+_PHYSICAL_STATE_RE = re.compile(r"Physical\s+state\s*:?\s*([^\n\r.]+)", _FIELD_FLAGS)
+_STATE_RE = re.compile(r"State\s*:?\s*([^\n\r.]+)", _FIELD_FLAGS)
+_FLASH_POINT_RE = re.compile(r"Flash\s+point\s*:?\s*([\d\-,]+[.,]?\d*)", _FIELD_FLAGS)
+_MELTING_POINT_RE = re.compile(r"Melting\s+point\s*:?\s*([\d\-,]+[.,]?\d*)", _FIELD_FLAGS)
+_BOILING_POINT_RE = re.compile(r"Boiling\s+point\s*:?\s*([\d\-,]+[.,]?\d*)", _FIELD_FLAGS)
+_VAPOUR_DENSITY_RE = re.compile(r"Relative\s+vapou?r\s+density\s*:?\s*([\d,]+[.,]?\d*)", _FIELD_FLAGS)
+_IGNITION_TEMP_RE = re.compile(r"(?:Auto|Self)[-\s]?ignition\s+temperature\s*:?\s*([\d,]+[.,]?\d*)", _FIELD_FLAGS)
+_TLV_RE = re.compile(r"TLV\s*:?\s*([^\n\r]+)", _FIELD_FLAGS)
+_LC50_RE = re.compile(r"LC50\s*[-:]\s*.*?([0-9,]+.*?)\s*(mg|g|ppm|mL|L)", _FIELD_FLAGS)
+
+# Density with multiple units
+_DENSITY_RES = [re.compile(p, _FIELD_FLAGS) for p in [
+    r"Density.*?([0-9]+[,.]?[0-9]*)\s*(kg/m3|g/cm3|g/mL|g/L)",
+    r"Density\s*:?\s*([\d,]+[.,]?\d*)\s*(?:g/cm³|g/cc|kg/m³)",
+    r"Specific\s+gravity\s*:?\s*([\d,]+[.,]?\d*)"
+]]
+
+_LD50_RES = [re.compile(p, _FIELD_FLAGS) for p in [
+    r"LD50.*?([0-9,]+[.,]?\d*)\s*mg/kg",
+    r"LD50\s*:?\s*([\d,]+[.,]?\d*)\s*mg/kg",
+    r"LD50\s*:?\s*(?:oral|dermal)?\s*([\d,]+[.,]?\d*)\s*mg/kg",
+    r"LD₅₀\s*:?\s*(?:oral|dermal)?\s*([\d,]+[.,]?\d*)\s*mg/kg"
+]]
+
+_CHEMICAL_NAME_RES = [re.compile(p, re.IGNORECASE) for p in [
+    r"Product name[:\s]*([^\n\r]+)",
+    r"Product Name[:\s]*([^\n\r]+)",
+    r"PRODUCT NAME[:\s]*([^\n\r]+)",
+    r"Product Name:[:\s]*([^\n\r]+)",
+    r"Product name\s*:[:\s]*([^\n\r]+)",
+    r"Identification of the substance[:\s]*([^\n\r]+)",
+]]
+
+# Keywords every pattern of a field family needs to match. Families whose
+# keywords never appear in the lowercased text are skipped instead of running
+# each of their patterns over the full text. Checked with plain substring
+# tests - a regex alternation over all of them is far slower on large texts.
+_FIELD_KEYWORDS = [
+    ("cas", ("cas",)),
+    ("flammable", ("lel", "uel", "lfl", "ufl", "lower", "upper", "explosive", "flammable", "burn", "combustible")),
+    ("static", ("static", "ground", "handling", "storage")),
+    ("state", ("state",)),
+    ("pressure", ("pressure",)),
+    ("flash", ("flash",)),
+    ("melting", ("melting",)),
+    ("boiling", ("boiling",)),
+    ("density", ("density", "specific")),
+    ("ignition", ("ignition",)),
+    ("tlv", ("tlv",)),
+    ("lc50", ("lc50",)),
+    ("ld50", ("ld50", "ld₅₀")),
+    ("name", ("product", "identification")),
+]
+
 def allowed_file(filename, allowed_extensions):
     return '.' in filename and filename.rsplit('.', 1)[1].lower() in allowed_extensions
 
-def extract_pdf_text_fallback(pdf_path):
-    """Extract text from PDF using PyPDF2 as fallback"""
+def extract_pdf_text_fallback(pdf_path, start_page=0):
+    """Extract text from PDF using PyPDF2 as fallback, from start_page on"""
     try:
-        text = ""
+        parts = []
         with open(pdf_path, 'rb') as file:
             pdf_reader = PyPDF2.PdfReader(file)
-            for page in pdf_reader.pages:
+            for page in pdf_reader.pages[start_page:]:
                 page_text = page.extract_text()
                 if page_text:
-                    text += page_text + "\n"
-        return text
+                    parts.append(page_text)
+        return "\n".join(parts)
     except Exception as e:
         logger.error(f"PyPDF2 extraction failed for {pdf_path}: {str(e)}")
         return ""
 
-def extract_pdf_text(pdf_path):
-    """Extract text from PDF file with fallback methods"""
-    text = ""
-    
-    # Try pdfplumber first
+def extract_pdf_text_pdfplumber(pdf_path, start_page=0):
+    """Extract text from PDF using pdfplumber as secondary fallback, from start_page on"""
     try:
+        parts = []
         with pdfplumber.open(pdf_path) as pdf:
-            for page in pdf.pages:
+            for page in pdf.pages[start_page:]:
                 page_text = page.extract_text()
                 if page_text:
-                    text += page_text + "\n"
-        
-        if text.strip():
-            logger.info(f"Successfully extracted text using pdfplumber from {os.path.basename(pdf_path)}")
-            return text
+                    parts.append(page_text)
+        return "\n".join(parts)
     except Exception as e:
         logger.warning(f"pdfplumber failed for {pdf_path}: {str(e)}")
+        return ""
+
+def iter_pdf_text(pdf_path, filename=None):
+    """
+    Yield text from PDF file page by page with fallback methods.
+    The fallback extractors yield the rest of the document as a single chunk,
+    also when PyMuPDF fails partway through after yielding some pages.
+    filename is used for logging and defaults to the path's basename.
+    """
+    filename = filename or os.path.basename(pdf_path)
+    has_text = False
+    next_page = 0
+    
+    # Try PyMuPDF first - much faster than the pure-Python extractors
+    try:
+        with fitz.open(pdf_path) as doc:
+            for page_number in range(len(doc)):
+                page_text = doc[page_number].get_text("text")
+                next_page = page_number + 1
+                if not has_text:
+                    # Hold back leading blank pages so a fallback doesn't follow them
+                    if not page_text.strip():
+                        continue
+                    has_text = True
+                yield page_text
+        if has_text:
+            logger.info(f"Successfully extracted text using PyMuPDF from {filename}")
+            return
+    except Exception as e:
+        logger.warning(f"PyMuPDF failed for {pdf_path}: {str(e)}")
+    
+    if has_text:
+        # Pages already yielded can't be taken back, so the fallbacks pick up at the failed page
+        logger.warning(f"PyMuPDF text of {filename} is partial, reading from page {next_page + 1} with fallbacks")
+        start_page = next_page
+    else:
+        start_page = 0
+    
+    # Fallback to pdfplumber (e.g. PDFs PyMuPDF returns no text for)
+    text = extract_pdf_text_pdfplumber(pdf_path, start_page)
+    if text.strip():
+        logger.info(f"Successfully extracted text using pdfplumber from {filename}")
+        yield text
+        return
     
     # Fallback to PyPDF2
-    text = extract_pdf_text_fallback(pdf_path)
+    text = extract_pdf_text_fallback(pdf_path, start_page)
     if text.strip():
-        logger.info(f"Successfully extracted text using PyPDF2 from {os.path.basename(pdf_path)}")
-        return text
+        logger.info(f"Successfully extracted text using PyPDF2 from {filename}")
+        yield text
+        return
+    
+    if has_text:
+        logger.warning(f"Fallbacks found no text after page {next_page} of {filename}, text is partial")
+    else:
+        logger.error(f"All text extraction methods failed for {pdf_path}")
+
+def extract_sds_text(pdf_path, filename=None):
+    """
+    Extract the text of every page of a PDF for parse_sds_data.
+    Returns (text, keywords) where keywords are the field keyword groups
+    present in text, so extract_sds_fields doesn't have to scan it again.
+    """
+    pages = []
+    keywords = set()
+    
+    for page_text in iter_pdf_text(pdf_path, filename):
+        pages.append(page_text)
+        # Keywords never contain a newline, so per-page results add up to the joined text's
+        keywords |= find_field_keywords(page_text.lower())
     
-    logger.error(f"All text extraction methods failed for {pdf_path}")
-    return ""
+    return "\n".join(pages), keywords
 
 def clean_numeric_value(value_str):
     """Clean and standardize numeric values"""
-    if not value_str or value_str.lower() in ['nda', 'n/a', 'not available']:
+    if not value_str or value_str.lower() in _MISSING_NUMERIC:
         return "NDA"
     
     # Remove extra whitespace and common prefixes
-    value_str = value_str.strip()
-    value_str = re.sub(r'^[:\-\s]+', '', value_str)
+    value_str = value_str.strip().lstrip(':- \t\r\n\f\v')
     
     # Extract first number found
-    number_match = re.search(r'([\d,]+[.,]?\d*)', value_str)
+    number_match = _NUMBER_RE.search(value_str)
     if number_match:
         number = number_match.group(1)
-        # Convert comma decimal separator to dot
-        number = re.sub(r'(\d+),(\d+)$', r'\1.\2', number)
+        # Convert comma decimal separator to dot ("12,5" -> "12.5", "1,234,5" -> "1,234.5")
+        head, comma, tail = number.rpartition(',')
+        if comma and head[-1:].isdecimal() and tail.isdecimal():
+            number = f"{head}.{tail}"
         return number
     
     return "NDA"
 
-def extract_flammable_limits(text):
+# No Hyperscan/Aho-Corasick pass with capture regexes run in small windows
+# around each literal hit: several patterns (LEL...UEL with DOTALL, LD50,
+# density) span arbitrary distances, so windowing would change results, and
+# this gate only decides which pattern families run at all.
+def find_field_keywords(text_lc):
+    """Return the names of the field keyword groups present in the lowercased text"""
+    return {name for name, keywords in _FIELD_KEYWORDS if any(keyword in text_lc for keyword in keywords)}
+
+def extract_flammable_limits(text, text_lc=None):
     """
     Extract flammable limits (LEL and UEL) with comprehensive pattern matching
     Returns formatted string like "LEL: X%, UEL: Y%" or individual values
+    text_lc is the lowercased text, computed here if the caller doesn't have it
     """
     
     # Initialize variables
     lel_value = None
     uel_value = None
     
-    # Comprehensive patterns for flammable limits
-    flammable_patterns = [
-        # Pattern 1: LEL and UEL on same line with percentages
-        r"LEL[:\s]*(\d+(?:\.\d+)?)\s*%.*?UEL[:\s]*(\d+(?:\.\d+)?)\s*%",
-        r"Lower\s+explosive\s+limit[:\s]*(\d+(?:\.\d+)?)\s*%.*?Upper\s+explosive\s+limit[:\s]*(\d+(?:\.\d+)?)\s*%",
-        r"LFL[:\s]*(\d+(?:\.\d+)?)\s*%.*?UFL[:\s]*(\d+(?:\.\d+)?)\s*%",
-        
-        # Pattern 2: Range format like "2.1 - 12.8%" or "2.1% - 12.8%"
-        r"(?:LEL|Lower\s+explosive\s+limit|LFL|Flammable\s+limits?)[:\s]*(\d+(?:\.\d+)?)\s*%?\s*[-–—]\s*(\d+(?:\.\d+)?)\s*%",
-        r"Explosive\s+limits?[:\s]*(\d+(?:\.\d+)?)\s*%?\s*[-–—]\s*(\d+(?:\.\d+)?)\s*%",
-        r"Flammability\s+limits?[:\s]*(\d+(?:\.\d+)?)\s*%?\s*[-–—]\s*(\d+(?:\.\d+)?)\s*%",
-        
-        # Pattern 3: Parentheses format like "(2.1 - 12.8%)" or "(LEL: 2.1%, UEL: 12.8%)"
-        r"\(\s*(\d+(?:\.\d+)?)\s*%?\s*[-–—]\s*(\d+(?:\.\d+)?)\s*%?\s*\)",
-        r"\(\s*LEL[:\s]*(\d+(?:\.\d+)?)\s*%.*?UEL[:\s]*(\d+(?:\.\d+)?)\s*%\s*\)",
-        
-        # Pattern 4: Table-like format with vol% or volume%
-        r"(?:LEL|Lower)[:\s]*(\d+(?:\.\d+)?)\s*(?:vol\s*%|%\s*vol|%|volume\s*%).*?(?:UEL|Upper)[:\s]*(\d+(?:\.\d+)?)\s*(?:vol\s*%|%\s*vol|%|volume\s*%)",
-        
-        # Pattern 5: Simple numeric range without explicit LEL/UEL labels but in flammable context
-        r"(?:Flammable|Explosive)\s+(?:range|limits?)[:\s]*(\d+(?:\.\d+)?)\s*[-–—]\s*(\d+(?:\.\d+)?)\s*%",
-        
-        # Pattern 6: Individual LEL/UEL on separate lines
-        r"LEL[:\s]*(\d+(?:\.\d+)?)\s*%",
-        r"UEL[:\s]*(\d+(?:\.\d+)?)\s*%",
-    ]
-    
-    # Try patterns that capture both LEL and UEL
-    for pattern in flammable_patterns[:5]:  # First 5 patterns capture both values
-        matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE | re.DOTALL)
-        if matches:
-            match = matches[0]
-            if len(match) == 2:
-                lel_value = match[0].strip()
-                uel_value = match[1].strip()
-                logger.debug(f"Found LEL/UEL pair with pattern '{pattern}': LEL={lel_value}%, UEL={uel_value}%")
-                break
+    # Try patterns that capture both LEL and UEL - the first hit is the result
+    for pattern in _FLAMMABLE_PAIR_RES:
+        match = pattern.search(text)
+        if match:
+            lel_value = match.group(1).strip()
+            uel_value = match.group(2).strip()
+            logger.debug(f"Found LEL/UEL pair with pattern '{pattern.pattern}': LEL={lel_value}%, UEL={uel_value}%")
+            return f"LEL: {lel_value}%, UEL: {uel_value}%"
     
     # If we didn't find a pair, try individual patterns
-    if not lel_value or not uel_value:
-        # Look for individual LEL
-        lel_patterns = [
-            r"LEL[:\s]*(\d+(?:\.\d+)?)\s*%",
-            r"Lower\s+explosive\s+limit[:\s]*(\d+(?:\.\d+)?)\s*%",
-            r"LFL[:\s]*(\d+(?:\.\d+)?)\s*%",
-            r"Lower\s+flammable\s+limit[:\s]*(\d+(?:\.\d+)?)\s*%"
-        ]
-        
-        for pattern in lel_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                lel_value = matches[0].strip()
-                logger.debug(f"Found individual LEL: {lel_value}%")
-                break
-        
-        # Look for individual UEL
-        uel_patterns = [
-            r"UEL[:\s]*(\d+(?:\.\d+)?)\s*%",
-            r"Upper\s+explosive\s+limit[:\s]*(\d+(?:\.\d+)?)\s*%",
-            r"UFL[:\s]*(\d+(?:\.\d+)?)\s*%",
-            r"Upper\s+flammable\s+limit[:\s]*(\d+(?:\.\d+)?)\s*%"
-        ]
-        
-        for pattern in uel_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE)
-            if matches:
-                uel_value = matches[0].strip()
-                logger.debug(f"Found individual UEL: {uel_value}%")
-                break
+    # Look for individual LEL
+    for pattern in _LEL_RES:
+        match = pattern.search(text)
+        if match:
+            lel_value = match.group(1).strip()
+            logger.debug(f"Found individual LEL: {lel_value}%")
+            break
+    
+    # Look for individual UEL
+    for pattern in _UEL_RES:
+        match = pattern.search(text)
+        if match:
+            uel_value = match.group(1).strip()
+            logger.debug(f"Found individual UEL: {uel_value}%")
+            break
     
     # Format the result
     if lel_value and uel_value:
@@ -203,20 +430,12 @@ def extract_flammable_limits(text):
         result = f"UEL: {uel_value}%"
     else:
         # Check for explicit "not applicable" or "non-flammable" statements
-        non_flammable_patterns = [
-            r"not\s+flammable",
-            r"non[-\s]?flammable",
-            r"flammable\s+limits?\s*:?\s*(?:not\s+applicable|n/?a)",
-            r"explosive\s+limits?\s*:?\s*(?:not\s+applicable|n/?a)",
-            r"does\s+not\s+burn",
-            r"will\s+not\s+burn",
-            r"non[-\s]?combustible"
-        ]
-        
-        for pattern in non_flammable_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                logger.debug(f"Found non-flammable indicator: {pattern}")
-                return "Non-flammable"
+        if text_lc is None:
+            text_lc = text.lower()
+        match = _NON_FLAMMABLE_RE.search(text_lc)
+        if match:
+            logger.debug(f"Found non-flammable indicator: {match.group(0)}")
+            return "Non-flammable"
         
         logger.debug("No flammable limits found")
         result = "NDA"
@@ -224,7 +443,73 @@ def extract_flammable_limits(text):
     return result
 
 
-def parse_sds_data(text, source_filename):
+# One connection per thread and process, so no lock is shared between request
+# threads and pool workers (a lock held during a fork would stay held in the
+# child forever) and no connection crosses a fork
+_sds_cache_local = threading.local()
+MAX_SDS_CACHE_ROWS = 4096
+
+def close_sds_cache(pid, connection):
+    """Close a cache connection, unless it was inherited over a fork from pid"""
+    if os.getpid() == pid:
+        connection.close()
+
+def get_sds_cache():
+    """Return this thread's connection to the parsed SDS cache"""
+    cache_db = getattr(_sds_cache_local, 'db', None)
+    if cache_db is None or cache_db[0] != os.getpid():
+        # Closed by whichever thread collects this one, or at exit for long-lived threads
+        connection = sqlite3.connect(SDS_CACHE_PATH, timeout=10, check_same_thread=False)
+        connection.execute("CREATE TABLE IF NOT EXISTS sds_cache (text_hash BLOB PRIMARY KEY, data TEXT NOT NULL)")
+        cache_db = _sds_cache_local.db = (os.getpid(), connection)
+        weakref.finalize(threading.current_thread(), close_sds_cache, *cache_db)
+    return cache_db[1]
+
+def load_cached_sds_data(text_hash):
+    """Return cached parsed data for a text hash, or None"""
+    try:
+        row = get_sds_cache().execute("SELECT data FROM sds_cache WHERE text_hash = ?", (text_hash,)).fetchone()
+        return json.loads(row[0]) if row else None
+    except sqlite3.Error as e:
+        logger.warning(f"SDS cache lookup failed: {str(e)}")
+        return None
+
+def store_cached_sds_data(text_hash, data):
+    """Store parsed data for a text hash; failures only disable caching"""
+    try:
+        connection = get_sds_cache()
+        with connection:
+            connection.execute("INSERT OR REPLACE INTO sds_cache (text_hash, data) VALUES (?, ?)", (text_hash, json.dumps(data)))
+            # Keep only the newest rows - replaced rows get a new rowid, so this drops the oldest writes
+            connection.execute(
+                "DELETE FROM sds_cache WHERE rowid <= (SELECT MAX(rowid) FROM sds_cache) - ?",
+                (MAX_SDS_CACHE_ROWS,)
+            )
+    except sqlite3.Error as e:
+        logger.warning(f"SDS cache write failed: {str(e)}")
+
+def parse_sds_data(text, source_filename, keywords=None):
+    """
+    Parse SDS data, reusing the cached result when the same text was parsed before.
+    keywords is the find_field_keywords result for text if the caller has it.
+    """
+    text_hash = hashlib.blake2b(_PARSER_VERSION + text.encode('utf-8', 'ignore'), digest_size=16).digest()
+    
+    # Use PDF filename as description (remove .pdf extension)
+    desc = os.path.splitext(source_filename)[0]
+    
+    cached = load_cached_sds_data(text_hash)
+    if cached is not None:
+        logger.info(f"Using cached SDS data for {source_filename}")
+        # Description comes from the filename, not the text
+        cached["Description"] = desc or "NDA"
+        return cached
+    
+    extracted_data = extract_sds_fields(text, source_filename, desc, keywords)
+    store_cached_sds_data(text_hash, extracted_data)
+    return extracted_data
+
+def extract_sds_fields(text, source_filename, desc=None, keywords=None):
     """Enhanced SDS data extraction with comprehensive pattern matching and debugging"""
     logger.info(f"Parsing SDS data from {source_filename}")
     
@@ -232,93 +517,64 @@ def parse_sds_data(text, source_filename):
     logger.debug(f"Text length: {len(text)} characters")
     logger.debug(f"First 500 chars: {text[:500]}")
     
-    def find_between(pattern, default="NDA", field_name=""):
-        matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE)
-        if matches:
-            result = matches[0].strip() if isinstance(matches[0], str) else str(matches[0]).strip()
+    # Lowercase once for the keyword-only scans
+    text_lc = text.lower()
+    
+    # Find which field families can match at all, unless text extraction already did
+    if keywords is None:
+        keywords = find_field_keywords(text_lc)
+    logger.debug(f"Field keywords present: {sorted(keywords)}")
+    
+    def find_between(pattern, default="NDA", field_name="", keyword=None):
+        if keyword is not None and keyword not in keywords:
+            logger.debug(f"No keyword found for {field_name}")
+            return default
+        match = pattern.search(text)
+        if match:
+            result = match.group(1).strip()
             result = clean_numeric_value(result) if any(char.isdigit() for char in result) else result
             logger.debug(f"Found {field_name}: {result}")
             return result
         logger.debug(f"No match found for {field_name}")
         return default
-    flammable_limits = extract_flammable_limits(text)
+    flammable_limits = extract_flammable_limits(text, text_lc) if "flammable" in keywords else "NDA"
     # Fixed CAS Number extraction - handles complete CAS number format
     def extract_cas_number(text):
         """Extract CAS number without applying numeric cleaning"""
-        cas_patterns = [
-            r"CAS-No\.?\s*[:\-]?\s*[\[\(]?\s*(\d{2,7}-\d{2}-\d)\s*[\]\)]?",
-            r"CAS\s+No\.?\s*[:\-]?\s*[\[\(]?\s*(\d{2,7}-\d{2}-\d)\s*[\]\)]?",
-            r"CAS\s+number\s*[:\-]?\s*[\[\(]?\s*(\d{2,7}-\d{2}-\d)\s*[\]\)]?",
-            r"CAS#?\s*[:\-]?\s*[\[\(]?\s*(\d{2,7}-\d{2}-\d)\s*[\]\)]?",
-            r"【CAS】\s*[:\-]?\s*[\[\(]?\s*(\d{2,7}-\d{2}-\d)\s*[\]\)]?",
-            # More flexible pattern for various CAS formats
-            r"(?:CAS|cas)(?:\s*-?\s*(?:No|NUMBER|#))?\s*[:\-]?\s*[\[\(]?\s*(\d{2,7}-\d{2}-\d)\s*[\]\)]?",
-            # Pattern for standalone CAS numbers (more restrictive to avoid false positives)
-            r"\b(\d{2,7}-\d{2}-\d)\b"
-        ]
-        
+        # Only the standalone pattern can match without a "CAS" label
+        cas_patterns = _CAS_RES if "cas" in keywords else _CAS_RES[-1:]
         for pattern in cas_patterns:
-            matches = re.findall(pattern, text, re.IGNORECASE | re.MULTILINE)
-            if matches:
-                cas_result = matches[0].strip()
-                logger.debug(f"Found CAS Number with pattern '{pattern}': {cas_result}")
+            match = pattern.search(text)
+            if match:
+                cas_result = match.group(1).strip()
+                logger.debug(f"Found CAS Number with pattern '{pattern.pattern}': {cas_result}")
                 return cas_result
         
         logger.debug("No CAS Number found")
         return "NDA"
     
-    def extract_static_hazard(text):
+    def extract_static_hazard(text_lc):
         """Extract static hazard information - return Yes/No/NDA based on static discharge mentions"""
-        # First check if there's any mention of static-related topics at all
-        static_patterns = [
-            r"static\s+discharge",
-            r"electrostatic\s+discharge",
-            r"static\s+electricity",
-            r"electrostatic\s+charge",
-            r"static\s+charge",
-            r"precautionary\s+measures\s+against\s+static\s+discharge",
-            r"measures\s+to\s+prevent.*static",
-            r"ground.*bond.*container",
-            r"grounding.*bonding",
-            r"anti[-\s]?static",
-            r"static\s+sensitive",
-            r"electrostatic\s+ignition",
-            r"static\s+buildup"
-        ]
-        
-        # Patterns that indicate NO static hazard
-        no_static_patterns = [
-            r"no\s+static\s+hazard",
-            r"static\s+hazard\s*:?\s*no",
-            r"not\s+static\s+sensitive",
-            r"no\s+electrostatic\s+hazard",
-            r"static\s+discharge\s*:?\s*not\s+applicable",
-            r"static\s+discharge\s*:?\s*n/?a"
-        ]
+        if "static" not in keywords:
+            logger.debug("No static hazard information or handling section found")
+            return "NDA"
         
         # Check for explicit "No" indicators first
-        for pattern in no_static_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                logger.debug(f"Found explicit no static hazard indicator: {pattern}")
+        for pattern in _NO_STATIC_RES:
+            if pattern.search(text_lc):
+                logger.debug(f"Found explicit no static hazard indicator: {pattern.pattern}")
                 return "No"
         
         # Check for "Yes" indicators
-        for pattern in static_patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                logger.debug(f"Found static hazard indicator: {pattern}")
+        for pattern in _STATIC_RES:
+            if pattern.search(text_lc):
+                logger.debug(f"Found static hazard indicator: {pattern.pattern}")
                 return "Yes"
         
         # Check if there's any mention of handling/storage sections where static info might be expected
-        handling_sections = [
-            r"SECTION\s*7.*?(?:handling|storage)",
-            r"handling\s+and\s+storage",
-            r"precautions\s+for\s+safe\s+handling",
-            r"storage\s+conditions"
-        ]
-        
         has_handling_section = False
-        for pattern in handling_sections:
-            if re.search(pattern, text, re.IGNORECASE):
+        for pattern in _HANDLING_RES:
+            if pattern.search(text_lc):
                 has_handling_section = True
                 break
         
@@ -336,89 +592,63 @@ def parse_sds_data(text, source_filename):
     cas_number = extract_cas_number(text)
     
     # Use PDF filename as description (remove .pdf extension)
-    desc = os.path.splitext(source_filename)[0]
+    if desc is None:
+        desc = os.path.splitext(source_filename)[0]
     
     # Enhanced pattern matching for various properties
-    physical_state = find_between(r"Physical\s+state\s*:?\s*([^\n\r.]+)", "NDA", "Physical State")
+    physical_state = find_between(_PHYSICAL_STATE_RE, "NDA", "Physical State", "state")
     if physical_state == "NDA":
-        physical_state = find_between(r"State\s*:?\s*([^\n\r.]+)", "NDA", "State")
+        physical_state = find_between(_STATE_RE, "NDA", "State", "state")
     
     
-    static_hazard = extract_static_hazard(text)
+    static_hazard = extract_static_hazard(text_lc)
     
     # Vapor pressure with unit conversion
     vapour_pressure = "NDA"
     vapour_temp = "21"  # Default temperature
     
     # Try different vapor pressure patterns
-    vp_patterns = [
-        r"Vapou?r\s+pressure\s*:?\s*([\d,]+[.,]?\d*)\s*atm",
-        r"Vapou?r\s+pressure\s*:?\s*([\d,]+[.,]?\d*)\s*mmHg",
-        r"Vapou?r\s+pressure\s*:?\s*([\d,]+[.,]?\d*)\s*Pa",
-        r"Pressure\s*:?\s*([\d,]+[.,]?\d*)\s*(?:atm|mmHg|Pa)"
-    ]
-    
-    for pattern in vp_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern, unit in (_VP_RES if "pressure" in keywords else []):
+        match = pattern.search(text)
         if match:
             value = clean_numeric_value(match.group(1))
             if value != "NDA":
-                if "atm" in pattern:
+                if unit == "atm":
                     vapour_pressure = f"{float(value) * 760:.1f}"
-                elif "Pa" in pattern:
+                elif unit == "Pa":
                     vapour_pressure = f"{float(value) * 0.00750062:.1f}"
                 else:
                     vapour_pressure = value
                 break
     
     # Temperature for vapor pressure
-    temp_match = re.search(r"(?:at|@)\s*(\d+)\s*°?C", text, re.IGNORECASE)
+    temp_match = _TEMP_RE.search(text)
     if temp_match:
         vapour_temp = temp_match.group(1)
     
     # Extract other properties with multiple patterns
-    flash_point = find_between(r"Flash\s+point\s*:?\s*([\d\-,]+[.,]?\d*)", "NDA", "Flash Point")
-    melting_point = find_between(r"Melting\s+point\s*:?\s*([\d\-,]+[.,]?\d*)", "NDA", "Melting Point")
-    boiling_point = find_between(r"Boiling\s+point\s*:?\s*([\d\-,]+[.,]?\d*)", "NDA", "Boiling Point")
+    flash_point = find_between(_FLASH_POINT_RE, "NDA", "Flash Point", "flash")
+    melting_point = find_between(_MELTING_POINT_RE, "NDA", "Melting Point", "melting")
+    boiling_point = find_between(_BOILING_POINT_RE, "NDA", "Boiling Point", "boiling")
     
     # Density with multiple units
-    density_patterns = [
-        r"Density.*?([0-9]+[,.]?[0-9]*)\s*(kg/m3|g/cm3|g/mL|g/L)",
-        r"Density\s*:?\s*([\d,]+[.,]?\d*)\s*(?:g/cm³|g/cc|kg/m³)",
-        r"Specific\s+gravity\s*:?\s*([\d,]+[.,]?\d*)"
-    ]
     density = "NDA"
-    for pattern in density_patterns:
-        density = find_between(pattern, "NDA", "Density")
+    for pattern in _DENSITY_RES:
+        density = find_between(pattern, "NDA", "Density", "density")
         if density != "NDA":
             break
     
     # LD50 extraction
-    ld50_patterns = [
-        r"LD50.*?([0-9,]+[.,]?\d*)\s*mg/kg",
-        r"LD50\s*:?\s*([\d,]+[.,]?\d*)\s*mg/kg",
-        r"LD50\s*:?\s*(?:oral|dermal)?\s*([\d,]+[.,]?\d*)\s*mg/kg",
-        r"LD₅₀\s*:?\s*(?:oral|dermal)?\s*([\d,]+[.,]?\d*)\s*mg/kg"
-    ]
     ld50 = "NDA"
-    for pattern in ld50_patterns:
-        ld50 = find_between(pattern, "NDA", "LD50")
+    for pattern in _LD50_RES:
+        ld50 = find_between(pattern, "NDA", "LD50", "ld50")
         if ld50 != "NDA":
             break
 
-    chemical_name_patterns = [
-        r"Product name[:\s]*([^\n\r]+)",
-        r"Product Name[:\s]*([^\n\r]+)", 
-        r"PRODUCT NAME[:\s]*([^\n\r]+)",
-        r"Product Name:[:\s]*([^\n\r]+)",
-        r"Product name\s*:[:\s]*([^\n\r]+)",
-        r"Identification of the substance[:\s]*([^\n\r]+)",
-    ]
-
     name = "NDA"
 
-    for pattern in chemical_name_patterns:
-        match = re.search(pattern, text, re.IGNORECASE)
+    for pattern in (_CHEMICAL_NAME_RES if "name" in keywords else []):
+        match = pattern.search(text)
         if match:
             extracted = match.group(1).strip()
 
@@ -439,18 +669,23 @@ def parse_sds_data(text, source_filename):
         "Vapour Pressure (in mmHg)": vapour_pressure,
         "at temp (in degC)": vapour_temp,
         "Flash Point (°C)": flash_point,
-        "Flammable Limits by Volume (LEL, UEL)": extract_flammable_limits(text),
+        "Flammable Limits by Volume (LEL, UEL)": flammable_limits,
         "Melting Point (°C)": melting_point,
         "Boiling Point (°C)": boiling_point,
         "Density (g/cc)": density,
-        "Relative Vapour Density (Air = 1)": find_between(r"Relative\s+vapou?r\s+density\s*:?\s*([\d,]+[.,]?\d*)", "NDA", "Vapor Density"),
-        "Ignition Temperature (°C)": find_between(r"(?:Auto|Self)[-\s]?ignition\s+temperature\s*:?\s*([\d,]+[.,]?\d*)", "NDA", "Ignition Temp"),
-        "Threshold Limit Value (ppm)": find_between(r"TLV\s*:?\s*([^\n\r]+)", "NDA", "TLV"),
-        "Immediate Danger to Life in Humans": find_between(r"LC50\s*[-:]\s*.*?([0-9,]+.*?)\s*(mg|g|ppm|mL|L)", "NDA"),
+        "Relative Vapour Density (Air = 1)": find_between(_VAPOUR_DENSITY_RE, "NDA", "Vapor Density", "density"),
+        "Ignition Temperature (°C)": find_between(_IGNITION_TEMP_RE, "NDA", "Ignition Temp", "ignition"),
+        "Threshold Limit Value (ppm)": find_between(_TLV_RE, "NDA", "TLV", "tlv"),
+        "Immediate Danger to Life in Humans": find_between(_LC50_RE, "NDA", "LC50", "lc50"),
         "Toxicological Info LD50 (mg/kg)": ld50,
         "Source of Information": "MSDS"
     }
     
+    # Canonicalize missing values so downstream checks don't need to case-fold
+    for key, value in extracted_data.items():
+        if value in _MISSING:
+            extracted_data[key] = "NDA"
+    
     # Log extracted data for debugging
     logger.info(f"Extracted data for {source_filename}:")
     for key, value in extracted_data.items():
@@ -459,6 +694,124 @@ def parse_sds_data(text, source_filename):
     
     return extracted_data
 
+def parser_fingerprint(value):
+    """Stable text form of a parser setting, with regexes spelled out in full"""
+    if isinstance(value, re.Pattern):
+        return f"re({value.pattern!r}, {value.flags})"
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(parser_fingerprint(item) for item in value) + "]"
+    if isinstance(value, (set, frozenset)):
+        return "{" + ", ".join(sorted(repr(item) for item in value)) + "}"
+    if callable(value):
+        try:
+            return inspect.getsource(value)
+        except (OSError, TypeError):
+            return value.__code__.co_code.hex()
+    return repr(value)
+
+# Cache results carry the parser they came from, so editing a pattern, the
+# columns or the parsing code can't serve results of the old parser
+_PARSER_GLOBALS = {
+    "COLUMNS", "_FIELD_KEYWORDS", "_MISSING", "_MISSING_NUMERIC",
+    "clean_numeric_value", "find_field_keywords", "extract_flammable_limits", "extract_sds_fields",
+}
+_PARSER_VERSION = hashlib.blake2b("\n".join(
+    parser_fingerprint(value) for name, value in sorted(globals().items())
+    if name.endswith(('_RE', '_RES', '_FLAGS')) or name in _PARSER_GLOBALS
+).encode('utf-8'), digest_size=8).digest()
+
+def process_pdf_file(pdf_path, filename=None):
+    """
+    Extract and parse a single PDF. Runs in a worker process.
+    Returns (filename, parsed_data, error) where parsed_data is None if the
+    file was skipped and error describes why.
+    """
+    filename = filename or os.path.basename(pdf_path)
+    try:
+        logger.info(f"Processing {filename}...")
+        text, keywords = extract_sds_text(pdf_path, filename)
+        
+        if text.strip():  # Only process if we got text
+            parsed_data = parse_sds_data(text, filename, keywords)
+            logger.info(f"Successfully processed {filename}")
+            return filename, parsed_data, None
+        
+        logger.warning(f"No text extracted from {filename}")
+        return filename, None, "no text extracted"
+    except Exception as e:
+        logger.error(f"Error processing {filename}: {str(e)}")
+        return filename, None, f"processing error: {str(e)}"
+
+# Process pool shared by all requests in this process, created on first use
+POOL_START_TIMEOUT = 60  # seconds for a new pool to run its first job
+_pdf_executor = None
+_pdf_executor_lock = threading.Lock()
+
+def pdf_pool_size():
+    """
+    Number of parser processes for this server process. PDF_WORKERS overrides;
+    otherwise the CPUs are split across the WEB_CONCURRENCY server workers
+    (gunicorn's default for -w) so the pools don't add up to workers x CPUs.
+    """
+    try:
+        return max(1, int(os.environ['PDF_WORKERS']))
+    except (KeyError, ValueError):
+        pass
+    try:
+        server_workers = max(1, int(os.environ.get('WEB_CONCURRENCY', 1)))
+    except ValueError:
+        server_workers = 1
+    return max(1, (os.cpu_count() or 1) // server_workers)
+
+def pdf_pool_context():
+    """
+    Start parser processes from a forkserver (or spawn) instead of forking the
+    threaded server process, which could copy locks held by other threads.
+    """
+    methods = multiprocessing.get_all_start_methods()
+    context = multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+    if context.get_start_method() == 'forkserver' and __name__ != '__main__':
+        # Import this module once in the fork server, not in every parser process
+        context.set_forkserver_preload([__name__])
+    return context
+
+def get_pdf_executor():
+    """
+    Return the pool for parsing PDFs across CPUs, reused across requests so
+    worker startup isn't paid per upload. Created lazily per process (e.g. per
+    gunicorn worker), sized by pdf_pool_size. Returns None (process serially)
+    when that is a single process or worker processes are unavailable. A new
+    pool runs one trivial job first, since forkserver/spawn start-up failures
+    only show up as BrokenProcessPool once work is submitted.
+    """
+    global _pdf_executor
+    with _pdf_executor_lock:
+        if _pdf_executor is None or _pdf_executor[0] != os.getpid():
+            executor = None
+            workers = pdf_pool_size()
+            if workers > 1:
+                try:
+                    executor = ProcessPoolExecutor(max_workers=workers, mp_context=pdf_pool_context())
+                    atexit.register(executor.shutdown, wait=False)
+                    executor.submit(os.getpid).result(timeout=POOL_START_TIMEOUT)
+                except Exception as e:
+                    # e.g. serverless runtimes without /dev/shm for multiprocessing, or a
+                    # fork server that can't start or import this module
+                    logger.warning(f"Parallel PDF processing unavailable, processing serially: {str(e) or type(e).__name__}")
+                    if executor is not None:
+                        executor.shutdown(wait=False, cancel_futures=True)
+                        executor = None
+            _pdf_executor = (os.getpid(), executor)
+        return _pdf_executor[1]
+
+def reset_pdf_executor():
+    """Drop a broken pool (e.g. a worker was killed) so the next request starts a new one"""
+    global _pdf_executor
+    with _pdf_executor_lock:
+        if _pdf_executor is not None and _pdf_executor[1] is not None:
+            _pdf_executor[1].shutdown(wait=False)
+        _pdf_executor = None
+
 def merge_by_cas_number_optional(rows, merge_duplicates=False):
     """
     Optionally group SDS entries by CAS number and merge each group into a single row.
@@ -471,26 +824,33 @@ def merge_by_cas_number_optional(rows, merge_duplicates=False):
         logger.info(f"Keeping all {len(rows)} entries without merging")
         return rows
     
-    merged = {}
+    df = pd.DataFrame(rows)
     
-    for row in rows:
-        cas_key = row.get("CAS Number", "").strip()
-        if cas_key.lower() in ["nda", "", "n/a"]:
-            # For entries without CAS numbers, use description as key to avoid merging
-            cas_key = f"no_cas_{row.get('Description', 'unknown')}_{len(merged)}"
-        
-        if cas_key not in merged:
-            merged[cas_key] = row.copy()
-        else:
-            # Merge data, preferring non-NDA values
-            for col in COLUMNS:
-                current = merged[cas_key].get(col, "NDA")
-                new = row.get(col, "NDA")
-                if current in ["", "NDA", None, "n/a"] and new not in ["", "NDA", None, "n/a"]:
-                    merged[cas_key][col] = new
+    cas_keys = df["CAS Number"].astype(str).str.strip()
+    no_cas = cas_keys.isin(_MISSING)
+    # For entries without CAS numbers, use a unique key per row to avoid merging
+    row_keys = pd.Series([f"no_cas_{i}" for i in range(len(df))], index=df.index)
+    cas_keys = cas_keys.mask(no_cas, row_keys).rename(None)
+    
+    # Merge data, preferring the first non-NDA value of each column in the group
+    present = df.mask(df.isin(_MISSING) | df.isna())
+    merged = present.groupby(cas_keys, sort=False).first()
+    
+    # Columns with no usable value anywhere in the group keep the first row's value
+    is_first = ~cas_keys.duplicated()
+    first_rows = df[is_first].set_index(cas_keys[is_first])
+    merged = merged.where(merged.notna(), first_rows).reindex(columns=df.columns)
     
     logger.info(f"Merged {len(rows)} entries into {len(merged)} unique entries")
-    return list(merged.values())
+    return merged.to_dict("records")
+
+def normalize_keys(values):
+    """Strip and lowercase values with numpy's element-wise string functions for case-insensitive matching"""
+    return np.char.lower(np.char.strip(np.asarray(values, dtype=str)))
+
+def not_in_keys(keys, existing_keys):
+    """Boolean mask that is True where a key is not in existing_keys, using a hashed isin lookup"""
+    return ~pd.Index(keys).isin(list(existing_keys))
 
 def check_for_duplicates(existing_df, new_data_df, duplicate_check_mode="description"):
     """
@@ -508,39 +868,71 @@ def check_for_duplicates(existing_df, new_data_df, duplicate_check_mode="descrip
     if len(existing_df) == 0:
         return new_data_df
     
-    # Create filters based on mode
-    duplicate_filters = []
+    # Keep mask over the new entries, narrowed by each applicable criterion.
+    # For "both" mode an entry must be new in BOTH CAS and description.
+    keep = np.ones(len(new_data_df), dtype=bool)
+    filtered = False
     
     if duplicate_check_mode in ["cas", "both"]:
         # Filter by CAS Number
         if "CAS Number" in existing_df.columns:
-            existing_cas = set(existing_df["CAS Number"].dropna().astype(str).str.strip().str.lower())
-            existing_cas.discard("nda")  # Remove NDA entries from duplicate check
-            cas_filter = ~new_data_df["CAS Number"].str.strip().str.lower().isin(existing_cas)
-            duplicate_filters.append(cas_filter)
+            existing_cas = set(normalize_keys(existing_df["CAS Number"].dropna()))
+            existing_cas -= _MISSING  # Remove NDA entries from duplicate check
+            keep &= not_in_keys(normalize_keys(new_data_df["CAS Number"]), existing_cas)
+            filtered = True
     
     if duplicate_check_mode in ["description", "both"]:
         # Filter by Description
         if "Description" in existing_df.columns:
-            existing_desc = set(existing_df["Description"].dropna().astype(str).str.strip().str.lower())
-            desc_filter = ~new_data_df["Description"].str.strip().str.lower().isin(existing_desc)
-            duplicate_filters.append(desc_filter)
+            existing_desc = set(normalize_keys(existing_df["Description"].dropna()))
+            keep &= not_in_keys(normalize_keys(new_data_df["Description"]), existing_desc)
+            filtered = True
     
     # Apply filters
-    if duplicate_filters:
-        if duplicate_check_mode == "both":
-            # For "both" mode, entry must be new in BOTH CAS and description
-            combined_filter = duplicate_filters[0] & duplicate_filters[1]
-        else:
-            # For single criteria, use that filter
-            combined_filter = duplicate_filters[0]
-        
-        filtered_df = new_data_df[combined_filter]
+    if filtered:
+        filtered_df = new_data_df[keep]
         logger.info(f"Duplicate check ({duplicate_check_mode}): {len(new_data_df)} -> {len(filtered_df)} entries")
         return filtered_df
     
     return new_data_df
 
+# Excel's per-cell text limit; xlsxwriter skips longer strings with a warning
+MAX_CELL_CHARS = 32767
+
+def excel_value(value, column):
+    """Map a DataFrame value to what write_excel puts in the cell"""
+    if pd.isna(value):
+        return None
+    if isinstance(value, str) and len(value) > MAX_CELL_CHARS:
+        logger.warning(f"Truncated {column} value of {len(value)} characters to Excel's {MAX_CELL_CHARS} limit")
+        return value[:MAX_CELL_CHARS]
+    return value
+
+def write_excel(df, output_path, sheet_name='SDS_Data'):
+    """
+    Write DataFrame to xlsx using xlsxwriter's constant_memory mode, which
+    flushes each row to disk so memory stays flat however large the sheet is.
+    Rows are written in order as constant_memory requires (pandas' to_excel
+    writes column by column, which that mode can't handle).
+    Strings are stored as text, not turned into hyperlinks or numbers.
+    """
+    workbook = xlsxwriter.Workbook(output_path, {
+        'constant_memory': True,
+        'strings_to_urls': False,
+        'strings_to_numbers': False,
+        'default_date_format': 'yyyy-mm-dd hh:mm:ss'
+    })
+    try:
+        worksheet = workbook.add_worksheet(sheet_name)
+        # Same header style pandas uses
+        header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+        columns = list(df.columns)
+        worksheet.write_row(0, 0, columns, header_format)
+        for row_idx, row in enumerate(df.itertuples(index=False, name=None), start=1):
+            worksheet.write_row(row_idx, 0, [excel_value(value, column) for value, column in zip(row, columns)])
+    finally:
+        workbook.close()
+
 @app.route('/')
 def index():
     return jsonify({
@@ -550,8 +942,10 @@ def index():
         'endpoints': {
             'upload': 'POST /api/upload',
             'download': 'GET /api/download/<session_id>/<filename>',
-            'cleanup': 'POST /api/cleanup',
-            'health': 'GET /api/health'
+            'cleanup': 'POST /api/cleanup (202, runs in the background)',
+            'health': 'GET /api/health',
+            'live': 'GET /api/live',
+            'batch': 'POST /api/batch'
         }
     })
 
@@ -590,41 +984,57 @@ def upload_files():
         session_dir = os.path.join(UPLOAD_FOLDER, session_id)
         os.makedirs(session_dir, exist_ok=True)
         
-        # Save uploaded files
-        pdf_paths = []
-        for pdf_file in pdf_files:
-            pdf_path = os.path.join(session_dir, secure_filename(pdf_file.filename))
-            pdf_file.save(pdf_path)
-            pdf_paths.append(pdf_path)
-            logger.info(f"Saved PDF: {pdf_file.filename}")
+        # Save uploaded files, handing each PDF to the worker pool as soon as it
+        # is on disk so parsing overlaps with writing the remaining uploads
+        pdf_jobs = []
+        futures = []
+        executor = get_pdf_executor() if len(pdf_files) > 1 else None
+        session_prefix = session_dir + os.sep  # joined once, not per file
+        pool_broken = False
+        try:
+            for index, pdf_file in enumerate(pdf_files):
+                filename = secure_filename(pdf_file.filename)
+                # Index prefix keeps the path unique - different uploads can share a
+                # secure_filename ("SDS (1).pdf" / "SDS_1.pdf") and a later save must
+                # not rewrite a file a worker is already reading
+                pdf_path = session_prefix + f"{index}_{filename}"
+                pdf_file.save(pdf_path, buffer_size=UPLOAD_BUFFER_SIZE)
+                pdf_jobs.append((pdf_path, filename))
+                if executor and not pool_broken:
+                    try:
+                        futures.append(executor.submit(process_pdf_file, pdf_path, filename))
+                    except BrokenProcessPool:
+                        pool_broken = True
+                logger.info(f"Saved PDF: {pdf_file.filename}")
+            
+            excel_path = os.path.join(session_dir, secure_filename(excel_file.filename))
+            excel_file.save(excel_path, buffer_size=UPLOAD_BUFFER_SIZE)
+            logger.info(f"Saved Excel: {excel_file.filename}")
+            
+            # Collect results in upload order
+            if executor and not pool_broken:
+                results = [future.result() for future in futures]
+        except BrokenProcessPool:
+            pool_broken = True
         
-        excel_path = os.path.join(session_dir, secure_filename(excel_file.filename))
-        excel_file.save(excel_path)
-        logger.info(f"Saved Excel: {excel_file.filename}")
+        if pool_broken:
+            # A worker died - parse this upload here and let the next request start a new pool
+            logger.warning("PDF worker pool broke, processing this upload serially")
+            reset_pdf_executor()
+        if not executor or pool_broken:
+            results = [process_pdf_file(pdf_path, filename) for pdf_path, filename in pdf_jobs]
         
         # Process PDF files and extract SDS data
         all_data = []
         processed_files = 0
         skipped_files = []
         
-        for pdf_path in pdf_paths:
-            filename = os.path.basename(pdf_path)
-            try:
-                logger.info(f"Processing {filename}...")
-                text = extract_pdf_text(pdf_path)
-                
-                if text.strip():  # Only process if we got text
-                    parsed_data = parse_sds_data(text, filename)
-                    all_data.append(parsed_data)
-                    processed_files += 1
-                    logger.info(f"Successfully processed {filename}")
-                else:
-                    skipped_files.append(f"{filename} (no text extracted)")
-                    logger.warning(f"No text extracted from {filename}")
-            except Exception as e:
-                error_msg = f"Error processing {filename}: {str(e)}"
-                logger.error(error_msg)
-                skipped_files.append(f"{filename} (processing error: {str(e)})")
+        for filename, parsed_data, error in results:
+            if parsed_data is not None:
+                all_data.append(parsed_data)
+                processed_files += 1
+            else:
+                skipped_files.append(f"{filename} ({error})")
         
         if not all_data:
             return jsonify({'error': 'No valid SDS data could be extracted from any PDF files. Please check if the PDFs contain readable text.'}), 400
@@ -634,16 +1044,12 @@ def upload_files():
         # Optionally merge data by CAS Number
         processed_data = merge_by_cas_number_optional(all_data, merge_duplicates)
         
-        # Create DataFrame with proper column structure
-        new_data_df = pd.DataFrame(processed_data)
-        
-        # Ensure all required columns exist
-        for col in COLUMNS:
-            if col not in new_data_df.columns:
-                new_data_df[col] = "NDA"
-        
-        # Reorder columns
-        new_data_df = new_data_df[COLUMNS]
+        # Create DataFrame with proper column structure, built column by column
+        columns_data = {col: [] for col in COLUMNS}
+        for row in processed_data:
+            for col in COLUMNS:
+                columns_data[col].append(row.get(col, "NDA"))
+        new_data_df = pd.DataFrame(columns_data, columns=COLUMNS)
         
         # Read existing Excel file
         try:
@@ -678,9 +1084,8 @@ def upload_files():
         output_path = os.path.join(PROCESSED_FOLDER, output_filename)
         
         # Save with proper formatting
-        with pd.ExcelWriter(output_path, engine='openpyxl') as writer:
-            combined_df.to_excel(writer, index=False, sheet_name='SDS_Data')
-            
+        write_excel(combined_df, output_path, sheet_name='SDS_Data')
+        
         logger.info(f"Saved updated Excel file: {output_filename}")
         
         # Prepare response message
@@ -731,57 +1136,273 @@ def download_file(session_id, filename):
     except Exception as e:
         return jsonify({'error': f'Error downloading file: {str(e)}'}), 500
 
+def scan_folder(path):
+    """Yield scandir entries for a folder, treating a missing folder as empty.
+
+    The folders are created at import, so this skips the exists() probe and
+    only pays for it if a tmp cleaner removed one from under us.
+    """
+    try:
+        with os.scandir(path) as entries:
+            yield from entries
+    except FileNotFoundError:
+        return
+
+# Removal helpers are EAFP - an entry that is already gone (another worker's
+# sweep got there first) counts as removed, without probing for it first.
+def fast_rmdir(path):
+    """Remove a flat directory by unlinking its files, returning False if it has subdirectories.
+
+    Session folders only ever hold the uploaded files, so this skips
+    shutil.rmtree's recursive walk and per-entry symlink checks.
+    """
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                return False
+            try:
+                os.unlink(entry.path)
+            except FileNotFoundError:
+                pass
+    os.rmdir(path)
+    return True
+
+def remove_dir_tree(path):
+    try:
+        if not fast_rmdir(path):
+            shutil.rmtree(path)  # not flat after all
+    except FileNotFoundError:
+        pass
+    return True
+
+def remove_file(path):
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+    return True
+
+def removal_jobs(victims):
+    """Turn (name, path, is_dir) cleanup victims into (func, arg, label, is_dir) executor jobs.
+
+    One job per entry, so a failure is logged against the path it hit.
+    """
+    return [(remove_dir_tree if is_dir else remove_file, path, name, is_dir) for name, path, is_dir in victims]
+
+# (folder mtimes, oldest surviving entry mtime) recorded by the last sweep
+# that found the folders exactly as it scanned them. Folder mtimes only move
+# when entries are added or removed, so while they are unchanged and that
+# oldest entry is still inside the retention window there is nothing new to
+# expire.
+LAST_CLEANUP_STATE = None
+
+def cleanup_folder_mtimes():
+    try:
+        return tuple(os.stat(folder).st_mtime_ns for folder in (UPLOAD_FOLDER, PROCESSED_FOLDER))
+    except FileNotFoundError:
+        return None
+
+def run_cleanup():
+    """Remove expired sessions and processed files, returning the counts and a summary message"""
+    global LAST_CLEANUP_STATE
+    # Remove files older than 24 hours
+    cutoff_ts = time.time() - 24 * 60 * 60
+    cleaned_sessions = 0
+    cleaned_files = 0
+    victims = []  # (name, path, is_dir)
+    oldest_kept = float('inf')
+    clean_sweep = True
+    
+    # Taken before the scan, so an upload landing mid-scan moves them past what gets recorded
+    folder_mtimes = cleanup_folder_mtimes()
+    
+    # Skip the scan entirely when nothing was added or removed and nothing has aged out since
+    last_state = LAST_CLEANUP_STATE
+    if last_state is not None and last_state[1] >= cutoff_ts and last_state[0] == folder_mtimes:
+        return {'removedSessions': 0, 'removedFiles': 0, 'message': 'Cleanup completed: nothing to do'}
+    
+    # Collect expired session dirs and processed files in one pass - scandir entries cache the type and stat info
+    for folder, is_dir in ((UPLOAD_FOLDER, True), (PROCESSED_FOLDER, False)):
+        kind = 'session' if is_dir else 'file'
+        for entry in scan_folder(folder):
+            try:
+                if is_dir and not entry.is_dir(follow_symlinks=False):
+                    continue
+                mtime = entry.stat(follow_symlinks=False).st_mtime
+                if mtime < cutoff_ts:
+                    victims.append((entry.name, entry.path, is_dir))
+                else:
+                    oldest_kept = min(oldest_kept, mtime)
+            except Exception as e:
+                clean_sweep = False
+                logger.error("Error cleaning %s %s: %s", kind, entry.name, e)
+    
+    # Deletes are I/O bound, so overlap them all on a single thread pool
+    with ThreadPoolExecutor(max_workers=CLEANUP_WORKERS) as executor:
+        futures = [(label, is_dir, executor.submit(func, arg)) for func, arg, label, is_dir in removal_jobs(victims)]
+        for label, is_dir, future in futures:
+            try:
+                removed = future.result()
+            except Exception as e:
+                removed = False
+                logger.error("Error cleaning %s %s: %s", 'session' if is_dir else 'file', label, e)
+            if not removed:
+                clean_sweep = False
+            elif is_dir:
+                cleaned_sessions += 1
+            else:
+                cleaned_files += 1
+    
+    # Anything left behind by a failure must be retried, so only remember clean sweeps.
+    # Folders that changed since the scan (our own deletes included) get a fresh scan next time.
+    if clean_sweep and folder_mtimes is not None and cleanup_folder_mtimes() == folder_mtimes:
+        LAST_CLEANUP_STATE = (folder_mtimes, oldest_kept)
+    else:
+        LAST_CLEANUP_STATE = None
+    
+    return {
+        'removedSessions': cleaned_sessions,
+        'removedFiles': cleaned_files,
+        'message': f'Cleanup completed: {cleaned_sessions} sessions and {cleaned_files} files removed'
+    }
+
+CLEANUP_INTERVAL = 60 * 60  # seconds between background sweeps
+_cleanup_lock = threading.Lock()  # held while a sweep is running
+_cleanup_scheduler_pid = None
+_cleanup_scheduler_lock = threading.Lock()
+_last_cleanup = None  # run_cleanup result of this worker's last sweep, plus completedAt
+
+def run_cleanup_locked():
+    """Run a sweep while holding _cleanup_lock, releasing it when done"""
+    global _last_cleanup
+    try:
+        result = run_cleanup()
+        result['completedAt'] = datetime.now().isoformat()
+        _last_cleanup = result
+        logger.info("%s", result['message'])
+    except Exception as e:
+        logger.error("Error during cleanup: %s", e)
+    finally:
+        _cleanup_lock.release()
+
+def start_cleanup():
+    """Start a sweep on a daemon thread; returns False if one is already running"""
+    if not _cleanup_lock.acquire(blocking=False):
+        return False
+    try:
+        threading.Thread(target=run_cleanup_locked, name='sds-cleanup', daemon=True).start()
+    except Exception:
+        _cleanup_lock.release()
+        raise
+    return True
+
+def cleanup_scheduler():
+    while True:
+        time.sleep(CLEANUP_INTERVAL)
+        if _cleanup_lock.acquire(blocking=False):
+            run_cleanup_locked()
+
+@app.before_request
+def ensure_cleanup_scheduler():
+    """Start the periodic cleanup thread once per worker process"""
+    global _cleanup_scheduler_pid
+    if _cleanup_scheduler_pid == os.getpid():
+        return
+    with _cleanup_scheduler_lock:
+        if _cleanup_scheduler_pid != os.getpid():
+            threading.Thread(target=cleanup_scheduler, name='sds-cleanup-scheduler', daemon=True).start()
+            _cleanup_scheduler_pid = os.getpid()
+
 @app.route('/api/cleanup', methods=['POST'])
 def cleanup_old_files():
+    """
+    Trigger a background sweep and return 202 without waiting for it.
+    lastRun holds the counts of this worker's previous sweep, if any.
+    """
     try:
-        # Remove files older than 24 hours
-        cutoff_time = datetime.now() - timedelta(hours=24)
-        cleaned_sessions = 0
-        cleaned_files = 0
-        
-        # Clean up upload folder
-        if os.path.exists(UPLOAD_FOLDER):
-            for session_id in os.listdir(UPLOAD_FOLDER):
-                session_dir = os.path.join(UPLOAD_FOLDER, session_id)
-                if os.path.isdir(session_dir):
-                    try:
-                        created_time = datetime.fromtimestamp(os.path.getctime(session_dir))
-                        if created_time < cutoff_time:
-                            shutil.rmtree(session_dir, ignore_errors=True)
-                            cleaned_sessions += 1
-                    except Exception as e:
-                        logger.error(f"Error cleaning session {session_id}: {str(e)}")
-        
-        # Clean up processed folder
-        if os.path.exists(PROCESSED_FOLDER):
-            for filename in os.listdir(PROCESSED_FOLDER):
-                file_path = os.path.join(PROCESSED_FOLDER, filename)
-                try:
-                    created_time = datetime.fromtimestamp(os.path.getctime(file_path))
-                    if created_time < cutoff_time:
-                        os.remove(file_path)
-                        cleaned_files += 1
-                except Exception as e:
-                    logger.error(f"Error cleaning file {filename}: {str(e)}")
-        
-        return jsonify({
-            'success': True, 
-            'message': f'Cleanup completed: {cleaned_sessions} sessions and {cleaned_files} files removed'
-        })
+        started = start_cleanup()
+        response = {
+            'success': True,
+            'message': 'Cleanup started' if started else 'Cleanup already running'
+        }
+        if _last_cleanup:
+            response['lastRun'] = _last_cleanup
+        return ojsonify(response, 202)
     
     except Exception as e:
-        return jsonify({'error': f'Error during cleanup: {str(e)}'}), 500
+        return ojsonify({'error': f'Error starting cleanup: {str(e)}'}, 500)
+
+def json_bytes(obj):
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(',', ':')).encode()
+
+def ojsonify(obj, status=200):
+    """jsonify replacement that serializes with orjson when it is installed"""
+    return Response(json_bytes(obj), status=status, mimetype='application/json')
+
+# Everything except the timestamp is fixed, so serialize it once with the closing brace cut off
+_HEALTH_STATIC = json_bytes({
+    'status': 'healthy',
+    'upload_folder': UPLOAD_FOLDER,
+    'processed_folder': PROCESSED_FOLDER,
+    'version': '2.1'
+})[:-1]
+
+HEALTH_TIMESTAMP_TTL = 0.5  # seconds a formatted health timestamp is reused
+_last_ts = (0.0, b'')  # (time.time() when formatted, encoded isoformat)
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return jsonify({
-        'status': 'healthy',
-        'timestamp': datetime.now().isoformat(),
-        'upload_folder': UPLOAD_FOLDER,
-        'processed_folder': PROCESSED_FOLDER,
-        'version': '2.1'
-    })
+    global _last_ts
+    now = time.time()
+    last = _last_ts
+    if now - last[0] > HEALTH_TIMESTAMP_TTL:
+        last = _last_ts = (now, datetime.fromtimestamp(now).isoformat().encode())
+    body = _HEALTH_STATIC + b',"timestamp":"' + last[1] + b'"}'
+    return Response(body, mimetype='application/json')
+
+MAX_BATCH_PATHS = 20
+
+@app.route('/api/batch', methods=['POST'])
+def batch_get():
+    """Run several JSON GET endpoints in one request and return {path: {status, body}}"""
+    paths = request.get_json(silent=True)
+    if not isinstance(paths, list) or not all(isinstance(path, str) for path in paths):
+        return ojsonify({'error': 'Expected a JSON list of GET paths'}, 400)
+    if len(paths) > MAX_BATCH_PATHS:
+        return ojsonify({'error': f'At most {MAX_BATCH_PATHS} paths per batch'}, 400)
+    
+    # Dispatch straight to the view functions instead of a full WSGI round trip per path
+    adapter = app.url_map.bind_to_environ(request.environ)
+    results = {}
+    for path in paths:
+        try:
+            endpoint, view_args = adapter.match(path, method='GET')
+            response = app.make_response(app.view_functions[endpoint](**view_args))
+        except HTTPException as e:
+            results[path] = {'status': e.code, 'error': e.name}
+            continue
+        except Exception as e:
+            results[path] = {'status': 500, 'error': str(e)}
+            continue
+        try:
+            if response.is_json:
+                results[path] = {'status': response.status_code, 'body': response.get_json()}
+            else:
+                results[path] = {'status': response.status_code, 'error': 'Response is not JSON'}
+        finally:
+            response.close()
+    return ojsonify(results)
+
+# A fresh Response per call - after_request hooks (CORS) mutate headers, so a shared object isn't safe
+_LIVE_BODY = b'OK'
+
+@app.route('/api/live', methods=['GET'])
+def liveness_check():
+    """Cheap liveness probe for load balancers - constant body, no JSON or timestamp"""
+    return Response(_LIVE_BODY, mimetype='text/plain')
 
 if __name__ == '__main__':
     print("🚀 Starting Enhanced SDS Processing Flask Server v2.1...")
@@ -792,4 +1413,13 @@ if __name__ == '__main__':
     print("🎛️  Processing options:")
     print("   - mergeDuplicates: Merge entries with same CAS number")
     print("   - duplicateCheck: none|cas|description|both")
-    app.run(debug=True, host='0.0.0.0', port=5000)
+    if os.environ.get('FLASK_ENV') == 'development':
+        app.run(debug=True, host='0.0.0.0', port=5000)
+    else:
+        try:
+            from waitress import serve
+        except ImportError:
+            logger.warning("waitress not installed, falling back to the threaded Flask server")
+            app.run(host='0.0.0.0', port=5000, threaded=True)
+        else:
+            serve(app, host='0.0.0.0', port=5000, threads=8)